@@ -9,27 +9,112 @@ configuration resolution, and tool validation.
 import argparse
 import json
 import os
+import re
+import shutil
 import subprocess
 import sys
+import threading
+import time
+from collections import ChainMap, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
-# Optional imports with fallback
-try:
-    from dotenv import load_dotenv
-    HAS_DOTENV = True
-except ImportError:
-    HAS_DOTENV = False
+# Optional dependencies are imported on first use so that code paths which never
+# read config files (e.g. --help) do not pay for them
 
-try:
-    import yaml
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
+
+@lru_cache(maxsize=None)
+def _get_yaml() -> Any:
+    """Return the PyYAML module, or None if it is not installed."""
+    try:
+        import yaml
+    except ImportError:
+        return None
+    return yaml
+
+
+@lru_cache(maxsize=None)
+def _get_load_dotenv() -> Any:
+    """Return python-dotenv's load_dotenv, or None if it is not installed."""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return None
+    return load_dotenv
+
+
+@lru_cache(maxsize=None)
+def _get_orjson() -> Any:
+    """Return the orjson module, or None if it is not installed."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _dumps_indented(obj: Any) -> str:
+    """Serialize obj as JSON indented by two spaces, using orjson when available."""
+    orjson = _get_orjson()
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            # Values orjson rejects (e.g. integers wider than 64 bits)
+            pass
+    # orjson writes UTF-8, so keep non-ASCII characters unescaped here as well
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+# Section separators for console output
+_BAR = "=" * 60
+_LEADING_NL_BAR = "\n" + _BAR
+_BAR_TRAILING_NL = _BAR + "\n"
+_BARNL = "\n" + _BAR + "\n"
+
+# Serializes multi-line console output from worker threads
+_PRINT_LOCK = threading.Lock()
+
+
+def _emit(lines: list[str]) -> None:
+    """Write lines to stdout in a single call, atomically with respect to other threads."""
+    with _PRINT_LOCK:
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+
+# Parsed config files keyed by path, validated against (st_mtime_ns, st_size)
+_MAX_FILE_CACHE = 100
+_YAML_CACHE: "OrderedDict[str, tuple[int, int, dict[str, Any]]]" = OrderedDict()
+_ENV_CACHE: "OrderedDict[str, tuple[int, int, dict[str, str]]]" = OrderedDict()
+
+
+def _cache_get(cache: OrderedDict, path: Path, st: os.stat_result) -> Optional[dict]:
+    """Return the cached parse of path if its mtime and size are unchanged."""
+    key = str(path)
+    hit = cache.get(key)
+    if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        cache.move_to_end(key)
+        # Callers only read the result, so hand back the cached dict as-is
+        return hit[2]
+    return None
+
+
+def _cache_put(cache: OrderedDict, path: Path, st: os.stat_result, value: dict) -> None:
+    """Store a parsed file in the cache, evicting the least recently used entry."""
+    cache[str(path)] = (st.st_mtime_ns, st.st_size, value)
+    cache.move_to_end(str(path))
+    if len(cache) > _MAX_FILE_CACHE:
+        cache.popitem(last=False)
 
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; the project still supports 3.9
+_DATACLASS_OPTIONS: dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class OrchestratorConfig:
     """Configuration for infrastructure orchestrator."""
     
@@ -64,40 +149,121 @@ class OrchestratorConfig:
             }
 
 
-def load_env_file(env_path: Path = Path(".env.example")) -> dict[str, str]:
+# Syntax that needs python-dotenv's parser (interpolation, quoting, inline
+# comments after any whitespace, export prefixes); files without it are
+# parsed manually
+_DOTENV_SYNTAX = re.compile(r'\$[{(]|["\']|[ \t]#|^[ \t]*export[ \t]', re.MULTILINE)
+
+
+def load_env_file(
+    env_path: Path = Path(".env.example"),
+    st: Optional[os.stat_result] = None,
+) -> dict[str, str]:
     """
     Load environment variables from .env file.
     
     Args:
         env_path: Path to the .env file
+        st: Stat result for env_path if the caller already has one
         
     Returns:
         Dictionary of environment variables
     """
-    env_vars = {}
-    
-    if HAS_DOTENV and env_path.exists():
+    if st is None:
+        try:
+            st = env_path.stat()
+        except OSError:
+            return {}
+    
+    cached = _cache_get(_ENV_CACHE, env_path, st)
+    if cached is not None:
+        return cached
+    
+    text = env_path.read_text()
+    # Single pass over the file, keeping only non-comment KEY=VALUE lines
+    pairs = [
+        (key.strip(), value.strip())
+        for key, sep, value in (line.partition('=') for line in text.splitlines())
+        if sep and key.strip() and not key.lstrip().startswith('#')
+    ]
+    
+    load_dotenv = _get_load_dotenv()
+    if load_dotenv is not None and not _DOTENV_SYNTAX.search(text):
+        # Plain KEY=VALUE file: the manual parse matches python-dotenv, so apply
+        # it to the environment directly instead of having dotenv re-read the file.
+        # Build the dict first so a repeated key resolves to its last value.
+        environ = os.environ
+        env_vars = {key: environ.setdefault(key, value) for key, value in dict(pairs).items()}
+    elif load_dotenv is not None:
         load_dotenv(env_path)
-        # Read the file to get the variables
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    # Get from environment or use the value from file
-                    env_vars[key.strip()] = os.getenv(key.strip(), value.strip())
-    elif env_path.exists():
+        # Get from environment or use the value from file
+        environ = os.environ
+        env_vars = {key: environ.get(key, value) for key, value in pairs}
+    else:
         # Manual parsing if dotenv not available
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    env_vars[key.strip()] = value.strip()
+        env_vars = dict(pairs)
     
+    _cache_put(_ENV_CACHE, env_path, st, env_vars)
     return env_vars
 
 
+# On-disk JSON copies of parsed YAML configs, stored next to the source file
+_JSON_CACHE_DIR = ".orchestrator_cache"
+
+# Files modified this recently may still change without their mtime moving
+# (the same "racy" window git uses), so they are not cached on disk
+_RACY_MTIME_NS = 2_000_000_000
+
+
+def _json_cache_path(config_path: Path, st: os.stat_result) -> Path:
+    """Return the JSON cache file for config_path at its current mtime and size."""
+    return config_path.parent / _JSON_CACHE_DIR / f"{config_path.name}.{st.st_mtime_ns}-{st.st_size}.json"
+
+
+def _read_json_cache(config_path: Path, st: os.stat_result) -> Optional[dict[str, Any]]:
+    """Load a previously cached parse of config_path, or None if there is none."""
+    try:
+        return json.loads(_json_cache_path(config_path, st).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json_cache(config_path: Path, st: os.stat_result, config: dict[str, Any]) -> None:
+    """
+    Persist a parsed YAML config as JSON and drop stale copies.
+    
+    Configs modified within the last couple of seconds, or that do not survive
+    a JSON round trip unchanged (e.g. dates or non-string keys), are not
+    cached. Failures to write are ignored.
+    """
+    if abs(time.time_ns() - st.st_mtime_ns) < _RACY_MTIME_NS:
+        return
+    
+    try:
+        text = json.dumps(config)
+        if json.loads(text) != config:
+            return
+    except (TypeError, ValueError):
+        return
+    
+    cache_path = _json_cache_path(config_path, st)
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(exist_ok=True)
+        # Only this config's copies; config.yaml.local.* belongs to another file
+        own_cache = re.compile(re.escape(config_path.name) + r"\.\d+-\d+\.json")
+        for stale in cache_path.parent.glob(f"{config_path.name}.*.json"):
+            if stale != cache_path and own_cache.fullmatch(stale.name):
+                stale.unlink()
+        tmp_path.write_text(text)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
 def load_yaml_config(config_path: Path = Path("config.yaml")) -> dict[str, Any]:
     """
     Load configuration from YAML file.
@@ -108,13 +274,64 @@ def load_yaml_config(config_path: Path = Path("config.yaml")) -> dict[str, Any]:
     Returns:
         Dictionary of configuration values
     """
-    if HAS_YAML and config_path.exists():
+    try:
+        st = config_path.stat()
+    except OSError:
+        return {}
+    
+    cached = _cache_get(_YAML_CACHE, config_path, st)
+    if cached is not None:
+        return cached
+    
+    config = _read_json_cache(config_path, st)
+    if config is None:
+        yaml = _get_yaml()
+        if yaml is None:
+            print(f"Warning: YAML library not available, skipping {config_path}")
+            return {}
+        
         with open(config_path) as f:
-            return yaml.safe_load(f) or {}
-    elif config_path.exists():
-        print(f"Warning: YAML library not available, skipping {config_path}")
+            # Prefer the libyaml-backed loader when PyYAML was built with it
+            loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+            config = yaml.load(f, Loader=loader) or {}
+        
+        _write_json_cache(config_path, st, config)
     
-    return {}
+    _cache_put(_YAML_CACHE, config_path, st, config)
+    return config
+
+
+# Defaults for the settings resolve_config merges across sources
+_CONFIG_DEFAULTS: dict[str, Any] = {
+    'subscription_id': None,
+    'location': 'eastus',
+    'env_name': 'dev',
+    'profile': 'default',
+    'dry_run': False,
+    'what_if': False,
+    'apply': False,
+    'destroy': False,
+}
+
+# Command-line argument -> OrchestratorConfig field
+_CLI_CONFIG_KEYS = {
+    'subscription': 'subscription_id',
+    'location': 'location',
+    'env': 'env_name',
+    'profile': 'profile',
+    'dry_run': 'dry_run',
+    'what_if': 'what_if',
+    'apply': 'apply',
+    'destroy': 'destroy',
+}
+
+# Environment variable -> OrchestratorConfig field
+_ENV_CONFIG_KEYS = {
+    'AZURE_SUBSCRIPTION_ID': 'subscription_id',
+    'AZURE_LOCATION': 'location',
+    'AZURE_ENV_NAME': 'env_name',
+    'PROFILE': 'profile',
+}
 
 
 def resolve_config(args: argparse.Namespace) -> OrchestratorConfig:
@@ -134,7 +351,13 @@ def resolve_config(args: argparse.Namespace) -> OrchestratorConfig:
         OrchestratorConfig with merged configuration
     """
     # Load from files
-    env_vars = load_env_file(Path(".env") if Path(".env").exists() else Path(".env.example"))
+    # Prefer .env, falling back to .env.example; stat once and reuse the result
+    env_path = Path(".env")
+    try:
+        env_stat = env_path.stat()
+    except OSError:
+        env_path, env_stat = Path(".env.example"), None
+    env_vars = load_env_file(env_path, env_stat)
     yaml_config = load_yaml_config()
     
     # Start with defaults from YAML
@@ -143,40 +366,29 @@ def resolve_config(args: argparse.Namespace) -> OrchestratorConfig:
     resources_config = yaml_config.get('resources', {})
     deployment_config = yaml_config.get('deployment', {})
     
+    # Each source only contributes values that are set (non-empty)
+    cli_values = {
+        name: getattr(args, arg) for arg, name in _CLI_CONFIG_KEYS.items() if getattr(args, arg)
+    }
+    env_values = {
+        name: env_vars[key] for key, name in _ENV_CONFIG_KEYS.items() if env_vars.get(key)
+    }
+    yaml_values = {
+        name: value for name, value in (
+            ('subscription_id', azure_config.get('subscription_id')),
+            ('location', azure_config.get('location')),
+            ('env_name', env_config.get('name')),
+            ('profile', env_config.get('profile')),
+            ('dry_run', deployment_config.get('dry_run')),
+            ('what_if', deployment_config.get('what_if')),
+        ) if value
+    }
+    
     # Build configuration with priority: CLI > ENV > YAML > Defaults
+    merged = ChainMap(cli_values, env_values, yaml_values, _CONFIG_DEFAULTS)
     config = OrchestratorConfig(
-        # Azure settings
-        subscription_id=(
-            args.subscription or
-            env_vars.get('AZURE_SUBSCRIPTION_ID') or
-            azure_config.get('subscription_id')
-        ),
-        location=(
-            args.location or
-            env_vars.get('AZURE_LOCATION') or
-            azure_config.get('location', 'eastus')
-        ),
-        
-        # Environment settings
-        env_name=(
-            args.env or
-            env_vars.get('AZURE_ENV_NAME') or
-            env_config.get('name', 'dev')
-        ),
-        profile=(
-            args.profile or
-            env_vars.get('PROFILE') or
-            env_config.get('profile', 'default')
-        ),
-        
-        # Resource settings
-        resources=resources_config if args.resources else resources_config,
-        
-        # Deployment settings
-        dry_run=args.dry_run or deployment_config.get('dry_run', False),
-        what_if=args.what_if or deployment_config.get('what_if', False),
-        apply=args.apply,
-        destroy=args.destroy,
+        resources=resources_config,
+        **{name: merged[name] for name in _CONFIG_DEFAULTS},
     )
     
     # Add extra parameters from --set flags
@@ -231,10 +443,33 @@ def run(command: list[str], capture: bool = True, check: bool = False) -> subpro
         raise
 
 
+# First line of each tool's version output, filled in on demand
+_TOOL_VERSIONS: dict[str, Optional[str]] = {}
+
+
+@lru_cache(maxsize=None)
+def _get_bicep_binary() -> Optional[str]:
+    """
+    Return the path to a standalone bicep binary, or None.
+    
+    Looks on PATH first, then in ~/.azure/bin where 'az bicep install' puts it.
+    """
+    return shutil.which('bicep') or shutil.which('bicep', path=str(Path.home() / '.azure' / 'bin'))
+
+
+def _get_tool_binary(tool: str) -> Optional[str]:
+    """Return the resolved path of a tool's executable, or None if not installed."""
+    if tool == 'bicep':
+        return _get_bicep_binary()
+    return shutil.which(tool)
+
+
 def require_tools(tools: Optional[list[str]] = None) -> dict[str, bool]:
     """
     Check if required tools are installed.
     
+    Availability is decided by a PATH lookup, without running the tools.
+    
     Args:
         tools: List of tool names to check (defaults to required tools from config)
         
@@ -244,45 +479,52 @@ def require_tools(tools: Optional[list[str]] = None) -> dict[str, bool]:
     if tools is None:
         tools = ['az', 'azd', 'bicep']
     
-    results = {}
-    
-    for tool in tools:
-        # Check if tool exists
-        if tool == 'bicep':
-            # Bicep is usually checked via az bicep version
-            result = run(['az', 'bicep', 'version'], capture=True)
-            results[tool] = result.returncode == 0
-        else:
-            result = run([tool, '--version'], capture=True)
-            results[tool] = result.returncode == 0
-    
-    return results
+    return {tool: _get_tool_binary(tool) is not None for tool in tools}
 
 
 def get_tool_version(tool: str) -> Optional[str]:
     """
     Get the version of a tool.
     
+    The tool is run at most once per process; results are memoized.
+    
     Args:
         tool: Tool name
         
     Returns:
         Version string or None if not available
     """
-    try:
-        if tool == 'bicep':
-            result = run(['az', 'bicep', 'version'], capture=True)
-        else:
-            result = run([tool, '--version'], capture=True)
+    if tool not in _TOOL_VERSIONS:
+        version = None
+        binary = _get_tool_binary(tool)
+        if binary:
+            result = run([binary, '--version'], capture=True)
+            output = (result.stdout or "").strip() if result.returncode == 0 else ""
+            # Keep first line of output
+            version = output.split('\n')[0] if output else None
+        _TOOL_VERSIONS[tool] = version
+    
+    return _TOOL_VERSIONS[tool]
+
+
+def get_tool_versions(tools: list[str]) -> dict[str, Optional[str]]:
+    """
+    Get the versions of several tools.
+    
+    Args:
+        tools: List of tool names
         
-        if result.returncode == 0:
-            output = result.stdout.strip()
-            # Return first line of output
-            return output.split('\n')[0] if output else None
-    except Exception:
-        pass
+    Returns:
+        Dictionary mapping tool names to version string or None
+    """
+    # Version commands are independent and spend their time waiting on child
+    # processes, so run the uncached ones concurrently
+    pending = [tool for tool in dict.fromkeys(tools) if tool not in _TOOL_VERSIONS]
+    if len(pending) > 1:
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            list(executor.map(get_tool_version, pending))
     
-    return None
+    return {tool: get_tool_version(tool) for tool in tools}
 
 
 def azd_env_set(key: str, value: str, env_name: Optional[str] = None) -> bool:
@@ -305,6 +547,10 @@ def azd_env_set(key: str, value: str, env_name: Optional[str] = None) -> bool:
     return result.returncode == 0
 
 
+# One KEY=VALUE assignment per line of 'azd env get-values' output
+_AZD_ENV_LINE = re.compile(r'^[ \t]*([^=\n]+)=(.*?)[ \t\r]*$', re.MULTILINE)
+
+
 def azd_env_get_values(env_name: Optional[str] = None) -> dict[str, str]:
     """
     Get all azd environment variables.
@@ -321,17 +567,14 @@ def azd_env_get_values(env_name: Optional[str] = None) -> dict[str, str]:
     
     result = run(cmd, capture=True)
     
-    env_vars = {}
-    if result.returncode == 0:
-        for line in result.stdout.split('\n'):
-            line = line.strip()
-            if line and '=' in line:
-                key, value = line.split('=', 1)
-                # Remove quotes if present
-                value = value.strip('"').strip("'")
-                env_vars[key] = value
+    if result.returncode != 0:
+        return {}
     
-    return env_vars
+    # Remove quotes if present
+    return {
+        match.group(1): match.group(2).strip('"').strip("'")
+        for match in _AZD_ENV_LINE.finditer(result.stdout)
+    }
 
 
 def bicep_validate(bicep_file: Path) -> bool:
@@ -345,21 +588,44 @@ def bicep_validate(bicep_file: Path) -> bool:
         True if valid, False otherwise
     """
     if not bicep_file.exists():
-        print(f"Error: Bicep file not found: {bicep_file}")
+        _emit([f"Error: Bicep file not found: {bicep_file}"])
         return False
     
-    result = run(['az', 'bicep', 'build', '--file', str(bicep_file), '--stdout'], capture=True)
+    bicep_bin = _get_bicep_binary()
+    if bicep_bin:
+        # The standalone CLI avoids booting az's Python runtime for every file
+        cmd = [bicep_bin, 'build', str(bicep_file), '--stdout']
+    else:
+        cmd = ['az', 'bicep', 'build', '--file', str(bicep_file), '--stdout']
+    
+    result = run(cmd, capture=True)
     
     if result.returncode == 0:
-        print(f"✓ Bicep file is valid: {bicep_file}")
+        _emit([f"✓ Bicep file is valid: {bicep_file}"])
         return True
     else:
-        print(f"✗ Bicep validation failed: {bicep_file}")
+        out = [f"✗ Bicep validation failed: {bicep_file}"]
         if result.stderr:
-            print(f"Error: {result.stderr}")
+            out.append(f"Error: {result.stderr}")
+        _emit(out)
         return False
 
 
+# Parameter names for the default resources, precomputed
+_CAMEL_CASE_NAMES = {
+    'container_registry': 'containerRegistry',
+    'storage_account': 'storageAccount',
+    'ai_services': 'aiServices',
+    'search_service': 'searchService',
+}
+
+
+def _to_camel_case(name: str) -> str:
+    """Convert a snake_case name to camelCase."""
+    param_name = ''.join(word.capitalize() for word in name.split('_'))
+    return param_name[0].lower() + param_name[1:]
+
+
 def build_infra_params(config: OrchestratorConfig) -> dict[str, Any]:
     """
     Build infrastructure parameters from configuration.
@@ -384,8 +650,7 @@ def build_infra_params(config: OrchestratorConfig) -> dict[str, Any]:
         if isinstance(resource_config, dict) and resource_config.get('enabled', True):
             # Convert resource name to parameter format
             # e.g., container_registry -> containerRegistry
-            param_name = ''.join(word.capitalize() for word in resource_name.split('_'))
-            param_name = param_name[0].lower() + param_name[1:]  # camelCase
+            param_name = _CAMEL_CASE_NAMES.get(resource_name) or _to_camel_case(resource_name)
             
             # Add enabled flag or specific config
             if 'sku' in resource_config:
@@ -399,50 +664,53 @@ def build_infra_params(config: OrchestratorConfig) -> dict[str, Any]:
 
 def print_config(config: OrchestratorConfig):
     """Print the resolved configuration."""
-    print("\n" + "="*60)
-    print("RESOLVED CONFIGURATION")
-    print("="*60)
-    
-    print("\nAzure Settings:")
-    print(f"  Subscription ID: {config.subscription_id or '(not set)'}")
-    print(f"  Location:        {config.location}")
-    
-    print("\nEnvironment Settings:")
-    print(f"  Environment:     {config.env_name}")
-    print(f"  Profile:         {config.profile}")
-    
-    print("\nDeployment Settings:")
-    print(f"  Dry Run:         {config.dry_run}")
-    print(f"  What-If:         {config.what_if}")
-    print(f"  Apply:           {config.apply}")
-    print(f"  Destroy:         {config.destroy}")
-    
-    print("\nResources:")
+    out = []
+    out.append(_LEADING_NL_BAR)
+    out.append("RESOLVED CONFIGURATION")
+    out.append(_BAR)
+    
+    out.append("\nAzure Settings:")
+    out.append(f"  Subscription ID: {config.subscription_id or '(not set)'}")
+    out.append(f"  Location:        {config.location}")
+    
+    out.append("\nEnvironment Settings:")
+    out.append(f"  Environment:     {config.env_name}")
+    out.append(f"  Profile:         {config.profile}")
+    
+    out.append("\nDeployment Settings:")
+    out.append(f"  Dry Run:         {config.dry_run}")
+    out.append(f"  What-If:         {config.what_if}")
+    out.append(f"  Apply:           {config.apply}")
+    out.append(f"  Destroy:         {config.destroy}")
+    
+    out.append("\nResources:")
     for name, res_config in config.resources.items():
         if isinstance(res_config, dict):
             enabled = res_config.get('enabled', True)
-            print(f"  {name:20s} {'enabled' if enabled else 'disabled'}")
+            out.append(f"  {name:20s} {'enabled' if enabled else 'disabled'}")
     
     if config.extra_params:
-        print("\nExtra Parameters:")
+        out.append("\nExtra Parameters:")
         for key, value in config.extra_params.items():
-            print(f"  {key}: {value}")
+            out.append(f"  {key}: {value}")
     
-    print("\nInfrastructure Parameters:")
-    params = build_infra_params(config)
-    print(json.dumps(params, indent=2))
+    out.append("\nInfrastructure Parameters:")
+    out.append(_dumps_indented(build_infra_params(config)))
     
-    print("="*60 + "\n")
+    out.append(_BAR_TRAILING_NL)
+    
+    _emit(out)
 
 
 def check_tools():
     """Check and print status of required tools."""
-    print("\n" + "="*60)
+    print(_LEADING_NL_BAR)
     print("TOOL VALIDATION")
-    print("="*60 + "\n")
+    print(_BAR_TRAILING_NL)
     
     tools = ['az', 'azd', 'bicep', 'docker', 'git']
     results = require_tools(tools)
+    versions = get_tool_versions([tool for tool in tools if results[tool]])
     
     all_required_available = True
     required_tools = ['az', 'azd', 'bicep']
@@ -450,21 +718,18 @@ def check_tools():
     for tool in tools:
         is_required = tool in required_tools
         available = results.get(tool, False)
+        version_str = versions.get(tool)
         status = "✓" if available else "✗"
         req_marker = "[REQUIRED]" if is_required else "[OPTIONAL]"
         
-        version = ""
-        if available:
-            version_str = get_tool_version(tool)
-            if version_str:
-                version = f" - {version_str}"
+        version = f" - {version_str}" if version_str else ""
         
         print(f"{status} {tool:15s} {req_marker:12s} {version}")
         
         if is_required and not available:
             all_required_available = False
     
-    print("\n" + "="*60 + "\n")
+    print(_BARNL)
     
     if not all_required_available:
         print("Warning: Some required tools are not available!")
@@ -475,9 +740,9 @@ def check_tools():
 
 def validate_bicep_files():
     """Validate Bicep files in the infra directory."""
-    print("\n" + "="*60)
+    print(_LEADING_NL_BAR)
     print("BICEP VALIDATION")
-    print("="*60 + "\n")
+    print(_BAR_TRAILING_NL)
     
     infra_dir = Path("infra")
     if not infra_dir.exists():
@@ -491,17 +756,27 @@ def validate_bicep_files():
         return False
     
     all_valid = True
-    for bicep_file in bicep_files:
-        if not bicep_validate(bicep_file):
-            all_valid = False
+    if _get_bicep_binary():
+        # Each build is dominated by CLI startup, so validate files concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(bicep_files))) as executor:
+            futures = [executor.submit(bicep_validate, bicep_file) for bicep_file in bicep_files]
+            for future in as_completed(futures):
+                if not future.result():
+                    all_valid = False
+    else:
+        # Without an installed binary 'az bicep build' may download bicep into
+        # ~/.azure/bin; concurrent runs would race on writing that file
+        for bicep_file in bicep_files:
+            if not bicep_validate(bicep_file):
+                all_valid = False
     
-    print("\n" + "="*60 + "\n")
+    print(_BARNL)
     
     return all_valid
 
 
-def main():
-    """Main entry point for the CLI orchestrator."""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(
         description="Infrastructure Orchestrator - Manage Azure infrastructure provisioning",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -584,7 +859,65 @@ Examples:
         help='Set additional parameters (can be used multiple times)'
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+# Defaults for every option build_parser defines
+_ARG_DEFAULTS: dict[str, Any] = {
+    'dry_run': False,
+    'what_if': False,
+    'apply': False,
+    'destroy': False,
+    'resources': False,
+    'profile': None,
+    'env': None,
+    'location': None,
+    'subscription': None,
+    'set': None,
+}
+
+# Single-flag invocations that can be answered without building the parser
+_FAST_PATH_FLAGS = {
+    '--dry-run': 'dry_run',
+    '--apply': 'apply',
+    '--destroy': 'destroy',
+}
+
+
+def _fast_parse_args(argv: list[str]) -> Optional[argparse.Namespace]:
+    """
+    Parse the common single-flag invocations without argparse.
+    
+    Args:
+        argv: Command-line arguments, excluding the program name
+        
+    Returns:
+        Parsed arguments with exactly one flag set, or None if argv needs the
+        full parser
+    """
+    if len(argv) != 1 or argv[0] not in _FAST_PATH_FLAGS:
+        return None
+    
+    args = argparse.Namespace(**_ARG_DEFAULTS)
+    setattr(args, _FAST_PATH_FLAGS[argv[0]], True)
+    return args
+
+
+def main():
+    """Main entry point for the CLI orchestrator."""
+    args = _fast_parse_args(sys.argv[1:])
+    if args is None:
+        parser = build_parser()
+        args = parser.parse_args()
+    
+    # No flags given: unless config.yaml turns on a deployment mode, show usage
+    # instead of resolving the full configuration
+    if not any(vars(args).values()):
+        deployment_config = load_yaml_config().get('deployment') or {}
+        if not (deployment_config.get('dry_run') or deployment_config.get('what_if')):
+            # Only reachable through the full parser: the fast path always sets a flag
+            parser.print_help()
+            return 0
     
     # Resolve configuration
     config = resolve_config(args)
@@ -619,7 +952,7 @@ Examples:
         print("Note: Actual resource destruction not yet implemented (configuration and validation only)")
         return 0
     
-    # Default: just show configuration
+    # Default (configuration flags only): just show configuration
     return 0
 
 
@@ -0,0 +1,301 @@
+# Copyright (c) Microsoft. All rights reserved.
+# Licensed under the MIT license.
+# See LICENSE file in the project root for full license information.
+import io
+import os
+import sys
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import main
+
+
+class TestLoadEnvFile(unittest.TestCase):
+    """Tests for the .env file loader."""
+
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        main._ENV_CACHE.clear()
+        self.addCleanup(main._ENV_CACHE.clear)
+
+    def _write_env(self, text: str) -> Path:
+        env_path = Path(self._tmpdir.name) / ".env"
+        env_path.write_text(text)
+        return env_path
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_duplicate_key_uses_last_value_without_dotenv(self):
+        env_path = self._write_env("DUPKEY=first\nDUPKEY=second\n")
+        with patch.object(main, "_get_load_dotenv", return_value=None):
+            env_vars = main.load_env_file(env_path)
+        self.assertEqual(env_vars, {"DUPKEY": "second"})
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_duplicate_key_uses_last_value_on_fast_path(self):
+        env_path = self._write_env("DUPKEY=first\nDUPKEY=second\n")
+        load_dotenv = MagicMock()
+        with patch.object(main, "_get_load_dotenv", return_value=load_dotenv):
+            env_vars = main.load_env_file(env_path)
+        load_dotenv.assert_not_called()
+        self.assertEqual(env_vars, {"DUPKEY": "second"})
+        self.assertEqual(os.environ["DUPKEY"], "second")
+
+    @patch.dict(os.environ, {"KEY": "from-env"}, clear=True)
+    def test_fast_path_does_not_override_environment(self):
+        env_path = self._write_env("KEY=from-file\n")
+        with patch.object(main, "_get_load_dotenv", return_value=MagicMock()):
+            env_vars = main.load_env_file(env_path)
+        self.assertEqual(env_vars, {"KEY": "from-env"})
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_comment_lines_stay_on_fast_path(self):
+        env_path = self._write_env("# heading\nKEY=value\n")
+        load_dotenv = MagicMock()
+        with patch.object(main, "_get_load_dotenv", return_value=load_dotenv):
+            env_vars = main.load_env_file(env_path)
+        load_dotenv.assert_not_called()
+        self.assertEqual(env_vars, {"KEY": "value"})
+
+    def test_inline_comments_use_dotenv(self):
+        for text in ("KEY=val # note\n", "KEY=val\t# note\n"):
+            with self.subTest(text=text), patch.dict(os.environ, {}, clear=True):
+                main._ENV_CACHE.clear()
+                env_path = self._write_env(text)
+                load_dotenv = MagicMock(side_effect=lambda path: os.environ.update(KEY="val"))
+                with patch.object(main, "_get_load_dotenv", return_value=load_dotenv):
+                    env_vars = main.load_env_file(env_path)
+                load_dotenv.assert_called_once_with(env_path)
+                self.assertEqual(env_vars, {"KEY": "val"})
+
+
+class TestYamlJsonCache(unittest.TestCase):
+    """Tests for the on-disk JSON cache of parsed YAML configs."""
+
+    OLD_MTIME_NS = 1_600_000_000_000_000_000
+
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        self.config_path = Path(self._tmpdir.name) / "config.yaml"
+        self.cache_dir = Path(self._tmpdir.name) / main._JSON_CACHE_DIR
+        main._YAML_CACHE.clear()
+        self.addCleanup(main._YAML_CACHE.clear)
+
+    def _write_config(self, text: str, mtime_ns: int = OLD_MTIME_NS) -> None:
+        self.config_path.write_text(text)
+        os.utime(self.config_path, ns=(mtime_ns, mtime_ns))
+
+    def _cache_name(self) -> str:
+        st = self.config_path.stat()
+        return f"config.yaml.{st.st_mtime_ns}-{st.st_size}.json"
+
+    def _cache_files(self) -> list[str]:
+        return sorted(p.name for p in self.cache_dir.iterdir()) if self.cache_dir.exists() else []
+
+    def test_cached_copy_is_read_without_yaml(self):
+        self._write_config("azure:\n  location: westus\n")
+        self.assertEqual(main.load_yaml_config(self.config_path), {"azure": {"location": "westus"}})
+        self.assertEqual(self._cache_files(), [self._cache_name()])
+
+        main._YAML_CACHE.clear()
+        with patch.object(main, "_get_yaml", return_value=None):
+            self.assertEqual(main.load_yaml_config(self.config_path), {"azure": {"location": "westus"}})
+
+    def test_recently_modified_file_is_not_cached(self):
+        self._write_config("azure:\n  location: westus\n", mtime_ns=time.time_ns())
+        self.assertEqual(main.load_yaml_config(self.config_path), {"azure": {"location": "westus"}})
+        self.assertEqual(self._cache_files(), [])
+
+    def test_change_replaces_own_stale_copies_only(self):
+        self.cache_dir.mkdir()
+        (self.cache_dir / "config.yaml.local.1-2.json").write_text("{}")
+        self._write_config("azure:\n  location: eastus\n")
+        main.load_yaml_config(self.config_path)
+
+        main._YAML_CACHE.clear()
+        self._write_config("azure:\n  location: westus\n", mtime_ns=self.OLD_MTIME_NS + 1)
+        self.assertEqual(main.load_yaml_config(self.config_path), {"azure": {"location": "westus"}})
+        self.assertEqual(
+            self._cache_files(),
+            [self._cache_name(), "config.yaml.local.1-2.json"],
+        )
+
+    def test_config_that_does_not_round_trip_is_not_cached(self):
+        self._write_config("released: 2024-01-01\n")
+        main.load_yaml_config(self.config_path)
+        self.assertEqual(self._cache_files(), [])
+
+    def test_failed_write_leaves_no_temp_file(self):
+        self._write_config("azure:\n  location: westus\n")
+        with patch.object(main.os, "replace", side_effect=OSError):
+            self.assertEqual(main.load_yaml_config(self.config_path), {"azure": {"location": "westus"}})
+        self.assertEqual(self._cache_files(), [])
+
+
+class TestResolveConfig(unittest.TestCase):
+    """Tests for configuration source precedence: CLI > ENV > YAML > defaults."""
+
+    def _resolve(self, argv: list[str], env_vars: dict, yaml_config: dict) -> main.OrchestratorConfig:
+        args = main.build_parser().parse_args(argv)
+        with patch.object(main, "load_env_file", return_value=env_vars), \
+                patch.object(main, "load_yaml_config", return_value=yaml_config):
+            return main.resolve_config(args)
+
+    def test_cli_overrides_env(self):
+        config = self._resolve(
+            ["--location", "cli-loc", "--env", "cli-env"],
+            {"AZURE_LOCATION": "env-loc", "AZURE_ENV_NAME": "env-env"},
+            {},
+        )
+        self.assertEqual((config.location, config.env_name), ("cli-loc", "cli-env"))
+
+    def test_env_overrides_yaml(self):
+        config = self._resolve(
+            [],
+            {"AZURE_SUBSCRIPTION_ID": "env-sub", "PROFILE": "env-profile"},
+            {"azure": {"subscription_id": "yaml-sub"}, "environment": {"profile": "yaml-profile"}},
+        )
+        self.assertEqual((config.subscription_id, config.profile), ("env-sub", "env-profile"))
+
+    def test_yaml_overrides_defaults(self):
+        config = self._resolve(
+            [],
+            {},
+            {"azure": {"location": "westus"}, "environment": {"name": "prod"}, "deployment": {"what_if": True}},
+        )
+        self.assertEqual((config.location, config.env_name, config.what_if), ("westus", "prod", True))
+
+    def test_defaults(self):
+        config = self._resolve([], {}, {})
+        self.assertEqual(
+            (config.subscription_id, config.location, config.env_name, config.profile, config.dry_run),
+            (None, "eastus", "dev", "default", False),
+        )
+
+    def test_empty_values_fall_through(self):
+        config = self._resolve(
+            [],
+            {"AZURE_LOCATION": "", "AZURE_SUBSCRIPTION_ID": ""},
+            {"azure": {"location": "westus", "subscription_id": None}},
+        )
+        self.assertEqual((config.location, config.subscription_id), ("westus", None))
+
+    def test_yaml_null_uses_default(self):
+        config = self._resolve([], {}, {"azure": {"location": None}, "environment": {"name": ""}})
+        self.assertEqual((config.location, config.env_name), ("eastus", "dev"))
+
+    def test_apply_and_destroy_come_from_cli_only(self):
+        yaml_config = {"deployment": {"apply": True, "destroy": True}}
+        env_vars = {"APPLY": "true", "DESTROY": "true"}
+        config = self._resolve([], env_vars, yaml_config)
+        self.assertEqual((config.apply, config.destroy), (False, False))
+        config = self._resolve(["--apply", "--destroy"], {}, {})
+        self.assertEqual((config.apply, config.destroy), (True, True))
+
+
+class TestMain(unittest.TestCase):
+    """Tests for the CLI entry point."""
+
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        cwd = os.getcwd()
+        os.chdir(self._tmpdir.name)
+        self.addCleanup(os.chdir, cwd)
+        main._YAML_CACHE.clear()
+        self.addCleanup(main._YAML_CACHE.clear)
+
+    def _run_main(self, argv: list[str], config_text: str) -> tuple[int, str, MagicMock]:
+        Path("config.yaml").write_text(config_text)
+        out = io.StringIO()
+        with patch.object(sys, "argv", ["main.py", *argv]), \
+                patch.object(main, "check_tools") as check_tools, \
+                patch.object(main, "validate_bicep_files"), \
+                redirect_stdout(out):
+            exit_code = main.main()
+        return exit_code, out.getvalue(), check_tools
+
+    def test_no_flags_prints_usage(self):
+        with patch.object(main, "load_env_file") as load_env_file:
+            exit_code, output, check_tools = self._run_main([], "deployment:\n  dry_run: false\n")
+        self.assertEqual(exit_code, 0)
+        self.assertTrue(output.startswith("usage:"))
+        self.assertNotIn("RESOLVED CONFIGURATION", output)
+        load_env_file.assert_not_called()
+        check_tools.assert_not_called()
+
+    def test_no_flags_follows_yaml_dry_run(self):
+        exit_code, output, check_tools = self._run_main([], "deployment:\n  dry_run: true\n")
+        self.assertEqual(exit_code, 0)
+        self.assertIn("Running in DRY-RUN mode", output)
+        check_tools.assert_called_once_with()
+
+    def test_config_flag_prints_configuration(self):
+        exit_code, output, check_tools = self._run_main(["--location", "westus"], "")
+        self.assertEqual(exit_code, 0)
+        self.assertIn("RESOLVED CONFIGURATION", output)
+        self.assertIn("Location:        westus", output)
+        check_tools.assert_not_called()
+
+
+class TestFastParseArgs(unittest.TestCase):
+    """Tests for the argparse-free fast path."""
+
+    def test_fast_path_matches_full_parser(self):
+        for flag in main._FAST_PATH_FLAGS:
+            with self.subTest(flag=flag):
+                self.assertEqual(main._fast_parse_args([flag]), main.build_parser().parse_args([flag]))
+
+    def test_fast_path_always_sets_a_flag(self):
+        for flag in main._FAST_PATH_FLAGS:
+            with self.subTest(flag=flag):
+                self.assertTrue(any(vars(main._fast_parse_args([flag])).values()))
+
+    def test_arg_defaults_cover_every_parser_option(self):
+        self.assertEqual(set(main._ARG_DEFAULTS), set(vars(main.build_parser().parse_args([]))))
+        self.assertEqual(main._ARG_DEFAULTS, vars(main.build_parser().parse_args([])))
+
+    def test_other_invocations_use_full_parser(self):
+        for argv in ([], ["--what-if"], ["--dry-run", "--env", "prod"], ["-h"]):
+            with self.subTest(argv=argv):
+                self.assertIsNone(main._fast_parse_args(argv))
+
+
+class TestValidateBicepFiles(unittest.TestCase):
+    """Tests for Bicep validation dispatch."""
+
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        infra_dir = Path(self._tmpdir.name) / "infra"
+        infra_dir.mkdir()
+        for name in ("a.bicep", "b.bicep", "c.bicep"):
+            (infra_dir / name).write_text("")
+        cwd = os.getcwd()
+        os.chdir(self._tmpdir.name)
+        self.addCleanup(os.chdir, cwd)
+
+    def test_without_binary_validates_serially(self):
+        with patch.object(main, "_get_bicep_binary", return_value=None), \
+                patch.object(main, "ThreadPoolExecutor") as executor, \
+                patch.object(main, "bicep_validate", return_value=True) as validate, \
+                patch("sys.stdout"):
+            self.assertTrue(main.validate_bicep_files())
+        executor.assert_not_called()
+        self.assertEqual(validate.call_count, 3)
+
+    def test_with_binary_validates_concurrently(self):
+        with patch.object(main, "_get_bicep_binary", return_value="/usr/bin/bicep"), \
+                patch.object(main, "bicep_validate", side_effect=lambda f: f.name != "b.bicep") as validate, \
+                patch("sys.stdout"):
+            self.assertFalse(main.validate_bicep_files())
+        self.assertEqual(validate.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()